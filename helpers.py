@@ -1,8 +1,11 @@
+import atexit
 import json
 import importlib
+import queue
 from pathlib import Path
 
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from src.docweaver.models import Task
 
@@ -28,28 +31,51 @@ NEW_CODE_EXAMPLE_MARKER = (
 )
 
 
+_FILE_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_CONSOLE_LOG_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+# Listener writing queued log records to the real handlers, if started, and
+# the log file it writes to
+_log_listener: QueueListener | None = None
+_log_file: Path | None = None
+
+
 def setup_logging(script_name: str):
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    log_file = log_dir / f"{Path(script_name).stem}.log"
+    global _log_listener, _log_file
+
+    log_file = Path("logs") / f"{Path(script_name).stem}.log"
+    # Already logging to this file, so there is nothing to set up again
+    if _log_listener is not None and _log_file == log_file:
+        return
+    log_file.parent.mkdir(exist_ok=True)
 
     # Clear previous handlers
+    if _log_listener is not None:
+        _log_listener.stop()
+        atexit.unregister(_log_listener.stop)
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file),
-        ],
-    )
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(_FILE_LOG_FORMATTER)
     # Add a handler for INFO level logs to the console
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
-    logging.getLogger().addHandler(console_handler)
+    console_handler.setFormatter(_CONSOLE_LOG_FORMATTER)
+
+    # File and console writes happen on a background thread, so logging from
+    # coroutines never blocks the event loop on I/O
+    log_queue = queue.Queue(-1)
+    logging.root.setLevel(logging.DEBUG)
+    logging.root.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    _log_file = log_file
+    atexit.register(_log_listener.stop)
 
 
 def load_task(task_name: str) -> Task:
@@ -5,14 +5,18 @@ from docweaver.pipeline import (
     make_changes,
     create_pr,
 )
+from docweaver.mcp_client import WeaviateDocsMCPClient
 from rich.console import Console
 import asyncio
 from helpers import setup_logging, load_task
 from pathlib import Path
-import json
+import orjson
+import logging
+import os
 import sys
 
-# List of tasks to run in sequence
+# Tasks to run. Their search, coordination and writing stages run concurrently
+# (see DEFAULT_MAX_PARALLEL_TASKS); their PRs are created one after another
 TASKS_TO_RUN = [
     "training_schema_design",
     "training_backup",
@@ -20,6 +24,14 @@ TASKS_TO_RUN = [
     "training_deployment"
 ]
 
+# Default number of doc writer calls in flight; override with the
+# DOCWEAVER_CONCURRENCY environment variable or --concurrency N
+DEFAULT_CONCURRENCY = 8
+
+# Default number of tasks whose search, coordination and writing stages run at
+# once; override with the DOCWEAVER_MAX_PARALLEL_TASKS environment variable
+DEFAULT_MAX_PARALLEL_TASKS = 2
+
 
 def get_task_description(task_name: str) -> str:
     """Returns formatted task description for agents."""
@@ -27,6 +39,37 @@ def get_task_description(task_name: str) -> str:
     return task.get_description()
 
 
+def parse_positive_int(value: str | None, source: str) -> int:
+    """Parses a setting that must be a whole number of at least 1, exiting otherwise."""
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        parsed = 0
+    if parsed < 1:
+        sys.exit(f"{source} must be a whole number of at least 1, got {value!r}")
+    return parsed
+
+
+def get_concurrency() -> int:
+    """Returns the doc writer concurrency from --concurrency N or DOCWEAVER_CONCURRENCY."""
+    if "--concurrency" in sys.argv:
+        flag_index = sys.argv.index("--concurrency")
+        value = sys.argv[flag_index + 1] if flag_index + 1 < len(sys.argv) else None
+        return parse_positive_int(value, "--concurrency")
+    value = os.getenv("DOCWEAVER_CONCURRENCY")
+    if value is None:
+        return DEFAULT_CONCURRENCY
+    return parse_positive_int(value, "DOCWEAVER_CONCURRENCY")
+
+
+def get_max_parallel_tasks() -> int:
+    """Returns the number of tasks to prepare at once from DOCWEAVER_MAX_PARALLEL_TASKS."""
+    value = os.getenv("DOCWEAVER_MAX_PARALLEL_TASKS")
+    if value is None:
+        return DEFAULT_MAX_PARALLEL_TASKS
+    return parse_positive_int(value, "DOCWEAVER_MAX_PARALLEL_TASKS")
+
+
 def clean_task_outputs(task_name: str, console: Console):
     """Delete all intermediate output files for a specific task."""
     task_output_dir = Path("outputs") / f"task_{task_name}"
@@ -38,53 +81,68 @@ def clean_task_outputs(task_name: str, console: Console):
 
 
 async def run_search_stage(
-    task_description: str, task_output_dir: Path, console: Console
+    task_description: str,
+    task_name: str,
+    task_output_dir: Path,
+    console: Console,
+    mcp_client: WeaviateDocsMCPClient,
+    no_cache: bool,
 ):
     """Run document search stage with caching."""
     output_path = task_output_dir / "doc_search_agent.log"
 
     if output_path.exists():
-        console.print(f"✓ Using existing search results from {output_path}")
-        with open(output_path) as f:
-            search_data = json.load(f)
+        console.print(f"{task_name}: ✓ Using existing search results from {output_path}")
+        with open(output_path, "rb") as f:
+            search_data = orjson.loads(f.read())
             return {"documents": search_data, "output_path": output_path}
 
-    console.print("🔍 Searching documents via MCP...")
-    result = await search_documents(task_description, output_path=str(output_path))
+    console.print(f"{task_name}: 🔍 Searching documents via MCP...")
+    result = await search_documents(
+        task_description,
+        output_path=str(output_path),
+        mcp_client=mcp_client,
+        no_cache=no_cache,
+    )
     if result['token_usage'] is not None:
-        console.print(f"   Token usage: {result['token_usage']}")
+        console.print(f"{task_name}: Token usage: {result['token_usage']}")
     return result
 
 
 async def run_coordinate_stage(
-    task_description: str, task_output_dir: Path, console: Console
+    task_description: str, task_name: str, task_output_dir: Path, console: Console
 ):
     """Run change coordination stage with caching."""
     output_path = task_output_dir / "doc_instructor_agent.log"
     search_results_path = task_output_dir / "doc_search_agent.log"
 
     if output_path.exists():
-        console.print(f"✓ Using existing instructions from {output_path}")
-        with open(output_path) as f:
-            instructions_data = json.load(f)
+        console.print(f"{task_name}: ✓ Using existing instructions from {output_path}")
+        with open(output_path, "rb") as f:
+            instructions_data = orjson.loads(f.read())
             return {
                 "instructions": instructions_data,
                 "documents_processed": len(instructions_data),
                 "output_path": output_path,
             }
 
-    console.print("📋 Coordinating changes...")
+    console.print(f"{task_name}: 📋 Coordinating changes...")
     result = await coordinate_changes(
         task_description,
         search_results_path=str(search_results_path),
         output_path=str(output_path),
     )
-    console.print(f"   Token usage: {result['token_usage']}")
+    console.print(f"{task_name}: Token usage: {result['token_usage']}")
     return result
 
 
 async def run_changes_stage(
-    task_description: str, task_output_dir: Path, console: Console
+    task_description: str,
+    task_name: str,
+    task_output_dir: Path,
+    console: Console,
+    writer_semaphore: asyncio.Semaphore,
+    no_cache: bool,
 ):
     """Run document changes stage with caching."""
     output_path = task_output_dir / "doc_writer_agent.log"
@@ -92,23 +150,25 @@ async def run_changes_stage(
     instructions_path = task_output_dir / "doc_instructor_agent.log"
 
     if output_path.exists():
-        console.print(f"✓ Using existing changes from {output_path}")
-        with open(output_path) as f:
-            changes_data = json.load(f)
+        console.print(f"{task_name}: ✓ Using existing changes from {output_path}")
+        with open(output_path, "rb") as f:
+            changes_data = orjson.loads(f.read())
             return {
                 "revised_documents": changes_data,
                 "files_changed": len(changes_data),
                 "output_path": output_path,
             }
 
-    console.print("✍️  Making changes...")
+    console.print(f"{task_name}: ✍️  Making changes...")
     result = await make_changes(
         task_description,
         instructions_path=str(instructions_path),
         output_path=str(output_path),
         edits_path=str(edits_path),
+        writer_semaphore=writer_semaphore,
+        no_cache=no_cache,
     )
-    console.print(f"   Processing time: {result['total_processing_time']:.2f} seconds")
+    console.print(f"{task_name}: Processing time: {result['total_processing_time']:.2f} seconds")
     return result
 
 
@@ -125,33 +185,57 @@ async def run_pr_stage(
     )
 
 
-async def run_task(task_name: str, console: Console):
-    """Runs the full pipeline for a single task."""
+async def prepare_task(
+    task_name: str,
+    console: Console,
+    mcp_client: WeaviateDocsMCPClient,
+    writer_semaphore: asyncio.Semaphore,
+    no_cache: bool,
+):
+    """Runs the search, coordination and changes stages for a single task."""
     console.rule(f"[bold green]Starting Task: {task_name}[/bold green]")
     task_output_dir = Path("outputs") / f"task_{task_name}"
     task_output_dir.mkdir(parents=True, exist_ok=True)
     task_description = get_task_description(task_name)
 
     # Stage 1: Search documents
-    result = await run_search_stage(task_description, task_output_dir, console)
-    print(f"\nDocument search complete. Found {len(result['documents'])} documents:")
+    result = await run_search_stage(
+        task_description, task_name, task_output_dir, console, mcp_client, no_cache
+    )
+    print(f"\n{task_name}: Document search complete. Found {len(result['documents'])} documents:")
     for doc in result["documents"]:
-        print(f"- {doc['path']}: {doc.get('reason', 'No reason provided')}")
-    print(f"Results saved to: {result['output_path']}\n")
+        print(f"{task_name}: - {doc['path']}: {doc.get('reason', 'No reason provided')}")
+    print(f"{task_name}: Results saved to: {result['output_path']}\n")
 
     # Stage 2: Coordinate changes
-    result = await run_coordinate_stage(task_description, task_output_dir, console)
-    print("Change coordination complete.")
-    print(f"Generated {len(result['instructions'])} editing instructions")
-    print(f"Processed {result['documents_processed']} documents")
-    print(f"Instructions saved to: {result['output_path']}\n")
+    result = await run_coordinate_stage(
+        task_description, task_name, task_output_dir, console
+    )
+    print(f"{task_name}: Change coordination complete.")
+    print(f"{task_name}: Generated {len(result['instructions'])} editing instructions")
+    print(f"{task_name}: Processed {result['documents_processed']} documents")
+    print(f"{task_name}: Instructions saved to: {result['output_path']}\n")
 
     # Stage 3: Make changes
-    result = await run_changes_stage(task_description, task_output_dir, console)
-    print("Document changes complete.")
-    print(f"Files changed: {result['files_changed']}")
-    print(f"Revised documents saved to: {result['output_path']}\n")
+    result = await run_changes_stage(
+        task_description,
+        task_name,
+        task_output_dir,
+        console,
+        writer_semaphore,
+        no_cache,
+    )
+    print(f"{task_name}: Document changes complete.")
+    print(f"{task_name}: Files changed: {result['files_changed']}")
+    print(f"{task_name}: Revised documents saved to: {result['output_path']}\n")
+
+    return task_description, task_output_dir
+
 
+async def finish_task(
+    task_name: str, task_description: str, task_output_dir: Path, console: Console
+):
+    """Runs the PR stage for a single prepared task."""
     # Stage 4: Create PR
     result = await run_pr_stage(task_description, task_name, task_output_dir, console)
     if result["success"]:
@@ -167,14 +251,54 @@ async def run_task(task_name: str, console: Console):
 async def main():
     setup_logging(__file__)
     console = Console()
+    # One limit on doc writer calls across all concurrently prepared tasks
+    writer_semaphore = asyncio.Semaphore(get_concurrency())
 
     # Handle --clean flag
     if "--clean" in sys.argv:
         for task_name in TASKS_TO_RUN:
             clean_task_outputs(task_name, console)
 
-    for task_name in TASKS_TO_RUN:
-        await run_task(task_name, console)
+    # Starting fresh also means fresh search results and writer responses,
+    # which then replace the cached ones
+    no_cache = "--no-cache" in sys.argv or "--clean" in sys.argv
+
+    task_semaphore = asyncio.Semaphore(get_max_parallel_tasks())
+
+    async def prepare_guarded(task_name: str, mcp_client: WeaviateDocsMCPClient):
+        async with task_semaphore:
+            return await prepare_task(
+                task_name, console, mcp_client, writer_semaphore, no_cache
+            )
+
+    # Tasks are independent until the PR stage, so their LLM-bound stages run
+    # concurrently. They share one MCP server session, which is only started
+    # if a search stage actually runs.
+    async with WeaviateDocsMCPClient() as mcp_client:
+        prepared = await asyncio.gather(
+            *(prepare_guarded(task_name, mcp_client) for task_name in TASKS_TO_RUN),
+            return_exceptions=True,
+        )
+
+    # PR creation writes to and switches branches in the shared docs checkout,
+    # so it runs one task at a time, once no task is reading the docs
+    failed_tasks = []
+    for task_name, result in zip(TASKS_TO_RUN, prepared):
+        if isinstance(result, BaseException):
+            logging.error(f"Task {task_name} failed", exc_info=result)
+            console.print(f"❌ Task {task_name} failed: {result}")
+            failed_tasks.append(task_name)
+            continue
+        task_description, task_output_dir = result
+        try:
+            await finish_task(task_name, task_description, task_output_dir, console)
+        except Exception as e:
+            logging.error(f"PR stage for task {task_name} failed", exc_info=e)
+            console.print(f"❌ PR stage for task {task_name} failed: {e}")
+            failed_tasks.append(task_name)
+
+    if failed_tasks:
+        sys.exit(f"{len(failed_tasks)} of {len(TASKS_TO_RUN)} tasks failed: {', '.join(failed_tasks)}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 from pydantic_ai import Agent, RunContext
 from pydantic import BaseModel, ConfigDict
 from pathlib import Path
+from functools import lru_cache
 import re
 import logging
 from helpers import DOCUMENTATION_META_INFO, NEW_CODE_EXAMPLE_MARKER
-import os
 from enum import Enum
 
 
@@ -141,53 +141,98 @@ class WeaviateDoc(BaseModel):
     referenced_docs: list["WeaviateDoc"]
 
 
-def parse_doc_refs(file_path: Path, include_code_body: bool = True) -> WeaviateDoc:
-    """Parse document and its direct references (first level only)."""
-    if not file_path.exists():
-        return WeaviateDoc(path=str(file_path), doc_body="", referenced_docs=[])
+# Extensions of code files that docs import via raw-loader
+CODE_EXTENSIONS = ["py"]
+
+# Suffixes (with the leading dot, as given by Path.suffix) for the membership
+# checks in parse_doc_refs
+_MARKDOWN_SUFFIXES = frozenset({".md", ".mdx"})
+_CODE_SUFFIXES = frozenset(f".{ext}" for ext in CODE_EXTENSIONS)
+
+# Matches `import X from "path"` statements for markdown and code files,
+# optionally via raw-loader
+_IMPORT_RE = re.compile(
+    r'import\s+\w+\s+from\s+["\'](?:!!raw-loader!)?([^"\']+\.(?:mdx?|'
+    + "|".join(CODE_EXTENSIONS)
+    + r'))["\']'
+)
+
+
+@lru_cache(maxsize=4096)
+def _read_file_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a file; memoized on path and mtime so edits invalidate the entry."""
+    # Text mode, so CRLF files get the same universal-newline translation as
+    # Path.read_text(). Docs are read and written as UTF-8 throughout.
+    with open(path_str, encoding="utf-8") as f:
+        return f.read()
 
-    content = file_path.read_text()
 
-    # Choose pattern based on whether code files should be included
-    code_extensions_list = ["py"]
-    file_extensions = r"mdx?|" + "|".join(code_extensions_list)
+@lru_cache(maxsize=4096)
+def _find_doc_imports(path_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """Find the markdown/code files imported by a document."""
+    content = _read_file_cached(path_str, mtime_ns)
+    return tuple(_IMPORT_RE.findall(content))
 
-    import_pattern = rf'import\s+\w+\s+from\s+["\'](?:!!raw-loader!)?([^"\']+\.(?:{file_extensions}))["\']'
-    matches = re.findall(import_pattern, content)
+
+def parse_doc_refs(file_path: Path, include_code_body: bool = True) -> WeaviateDoc:
+    """Parse document and its direct references (first level only).
+
+    File reads and import scans are cached by path and mtime, so unchanged
+    files are only read and parsed once per process.
+    """
+    # One stat both checks existence and gives the mtime for the cache keys
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError:  # Missing, or not reachable as a file, as with exists()
+        return WeaviateDoc(path=str(file_path), doc_body="", referenced_docs=[])
+
+    content = _read_file_cached(str(file_path), mtime_ns)
+    matches = _find_doc_imports(str(file_path), mtime_ns)
 
     referenced_docs = []
+    seen_imports = set()  # A file imported more than once is only loaded once
     for match in matches:
         if match.startswith("/"):
             import_path: Path = Path("docs") / match.lstrip("/")
         else:
             import_path: Path = Path("docs") / match
+        if import_path in seen_imports:
+            continue
+        seen_imports.add(import_path)
+
+        try:
+            ref_mtime_ns = import_path.stat().st_mtime_ns
+        except OSError:
+            continue
+
+        ext = import_path.suffix.lower()
+        # Only load the referenced file if markdown or include_code_body
+        if ext in _MARKDOWN_SUFFIXES or include_code_body:
+            ref_content = _read_file_cached(str(import_path), ref_mtime_ns)
+        elif ext in _CODE_SUFFIXES:
+            ref_content = "Body of code not included for brevity."
+        else:
+            ref_content = "Body not included for brevity."
 
-        _, ext = os.path.splitext(import_path.absolute())
-        if import_path.exists():
-            # Only load the referenced file if markdown or include_code_body
-            if "md" in ext or include_code_body:
-                ref_content = import_path.read_text()
-            elif ext in code_extensions_list:
-                ref_content = "Body of code not included for brevity."
-            else:
-                ref_content = "Body not included for brevity."
-
-            ref_doc = WeaviateDoc(
-                path=str(import_path), doc_body=ref_content, referenced_docs=[]
-            )
-            referenced_docs.append(ref_doc)
+        ref_doc = WeaviateDoc(
+            path=str(import_path), doc_body=ref_content, referenced_docs=[]
+        )
+        referenced_docs.append(ref_doc)
 
     return WeaviateDoc(
         path=str(file_path), doc_body=content, referenced_docs=referenced_docs
     )
 
 
-doc_writer_agent = Agent(
-    model="anthropic:claude-3-5-haiku-latest",
-    # model="anthropic:claude-4-sonnet-20250514",
-    output_type=list[DocOutput],
-    retries=3,
-    system_prompt=f"""
+# Output token budget for a single doc writer call. Writers return line-based
+# edits rather than whole documents, so this is ample. It matches pydantic-ai's
+# current Anthropic default and is pinned so the budget holds if that default
+# changes or the writer moves to another provider.
+DOC_WRITER_MAX_TOKENS = 4096
+
+
+# Kept separate from the agent so that it can be part of the doc writer cache key
+DOC_WRITER_SYSTEM_PROMPT = f"""
     You are a great technical writer and developer, who is very familar with Weaviate.
 
     You will be given a set of instructions on
@@ -306,7 +351,16 @@ doc_writer_agent = Agent(
       "end_line": 67,
       "replacement_txt": "\\n> **Note**: As of v2.5, performance has improved by 2x for large datasets."
     }}
-    """,
+    """
+
+
+doc_writer_agent = Agent(
+    model="anthropic:claude-3-5-haiku-latest",
+    # model="anthropic:claude-4-sonnet-20250514",
+    output_type=list[DocOutput],
+    retries=3,
+    model_settings={"max_tokens": DOC_WRITER_MAX_TOKENS},
+    system_prompt=DOC_WRITER_SYSTEM_PROMPT,
 )
 
 class PRContent(BaseModel):
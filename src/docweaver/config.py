@@ -1,2 +1,8 @@
 # Documentation paths (used for resolving relative file paths during editing)
 DOCS_BASE_PATH = "docs/docs/"
+
+# On-disk cache of doc writer responses, keyed by a hash of the prompt
+DOC_WRITER_CACHE_DIR = "outputs/.cache/doc_writer"
+
+# On-disk cache of MCP search results, keyed by a hash of the normalized query
+SEARCH_CACHE_DIR = "outputs/.cache/search"
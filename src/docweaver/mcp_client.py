@@ -1,20 +1,95 @@
 """MCP client for weaviate-docs-mcp server."""
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from .config import SEARCH_CACHE_DIR
+
 logger = logging.getLogger(__name__)
 
+# Search results are cached on disk, keyed by the normalized query, so reruns
+# skip the server round-trip and vector search. Entries older than this are
+# refetched, as the docs index may have been rebuilt in the meantime.
+SEARCH_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Beyond this many entries, the least recently written ones are removed
+SEARCH_CACHE_MAX_ENTRIES = 1_000
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse case and whitespace so trivially different queries share a cache entry."""
+    return " ".join(query.split()).lower()
+
+
+def _search_cache_path(query: str, return_type: str) -> Path:
+    """Path of the cached results for a search."""
+    key = hashlib.sha256(
+        f"{return_type}\n{_normalize_query(query)}".encode()
+    ).hexdigest()
+    return Path(SEARCH_CACHE_DIR) / f"{key}.json"
+
+
+def _read_cached_search(cache_path: Path) -> list[dict[str, Any]] | None:
+    """Return cached search results, or None if missing, expired or unreadable."""
+    try:
+        if time.time() - cache_path.stat().st_mtime >= SEARCH_CACHE_TTL_SECONDS:
+            return None
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable search cache entry {cache_path}: {e}")
+        return None
+
+
+def _prune_search_cache(cache_dir: Path) -> None:
+    """Remove expired entries, then the oldest ones beyond the size bound."""
+    entries = []
+    now = time.time()
+    for entry in cache_dir.glob("*.json"):
+        try:
+            mtime = entry.stat().st_mtime
+            if now - mtime >= SEARCH_CACHE_TTL_SECONDS:
+                entry.unlink()
+            else:
+                entries.append((mtime, entry))
+        except FileNotFoundError:
+            continue  # Removed by a concurrent prune
+    entries.sort()
+    for _, entry in entries[: max(0, len(entries) - SEARCH_CACHE_MAX_ENTRIES)]:
+        entry.unlink(missing_ok=True)
+
+
+def _write_cached_search(cache_path: Path, documents: list[dict[str, Any]]) -> None:
+    """Cache search results, replacing the entry atomically."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(documents, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _prune_search_cache(cache_path.parent)
+
 
 class WeaviateDocsMCPClient:
-    """Client for interacting with the weaviate-docs-mcp server."""
+    """Client for interacting with the weaviate-docs-mcp server.
+
+    Used as an async context manager, the client keeps a single server process
+    and MCP session open for all searches made inside the block. Used bare, each
+    search starts and tears down its own server process.
+    """
 
     def __init__(self, server_directory: str = None):
         """Initialize the MCP client.
@@ -35,56 +110,115 @@ class WeaviateDocsMCPClient:
         else:
             self.env = os.environ.copy()
 
+        self._closing: asyncio.Event | None = None
+        self._session_task: asyncio.Task | None = None
+        self._session_ready: asyncio.Future | None = None
+
+    async def __aenter__(self) -> "WeaviateDocsMCPClient":
+        self._closing = asyncio.Event()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._closing.set()
+        if self._session_task is not None:
+            await asyncio.gather(self._session_task, return_exceptions=True)
+        self._closing = None
+        self._session_task = None
+        self._session_ready = None
+
+    def _server_params(self) -> StdioServerParameters:
+        return StdioServerParameters(
+            command="uv",
+            args=[
+                "--directory",
+                str(self.server_directory),
+                "run",
+                "weaviate-docs-mcp",
+            ],
+            env=self.env,
+        )
+
+    async def _run_session(self, ready: asyncio.Future) -> None:
+        """Own the shared server process and session until the client is closed.
+
+        The stdio transport must be entered and exited from the same task, so a
+        dedicated task holds it open rather than whichever caller searched first.
+        """
+        try:
+            async with stdio_client(self._server_params()) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await self._closing.wait()
+        except Exception as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+    async def _get_session(self) -> ClientSession:
+        """Return the shared session, starting the server on first use."""
+        if self._session_task is None:
+            self._session_ready = asyncio.get_running_loop().create_future()
+            self._session_task = asyncio.create_task(
+                self._run_session(self._session_ready)
+            )
+        return await self._session_ready
+
     async def search_docs(
-        self, query: str, return_type: str = "full_documents"
+        self, query: str, return_type: str = "full_documents", no_cache: bool = False
     ) -> list[dict[str, Any]]:
         """Search documentation using the MCP server.
 
         Args:
             query: Search query to find relevant documentation
             return_type: Format of results (default: "full_documents")
+            no_cache: Always query the server, e.g. after the docs index was
+                updated. The fresh results still replace any cached entry.
 
         Returns:
             List of search results with document content
         """
         logger.info(f"Searching docs via MCP with query: {query}")
 
-        server_params = StdioServerParameters(
-            command="uv",
-            args=[
-                "--directory",
-                str(self.server_directory),
-                "run",
-                "weaviate-docs-mcp",
-            ],
-            env=self.env,
-        )
+        cache_path = _search_cache_path(query, return_type)
+        documents = None if no_cache else _read_cached_search(cache_path)
+        if documents is not None:
+            logger.info(f"Using cached MCP search results ({len(documents)} documents)")
+            return documents
 
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                # Call the search_docs tool
-                result = await session.call_tool(
-                    "search_docs", arguments={"query": query, "return_type": return_type}
-                )
-
-                # Parse the result - MCP returns TextContent
-                if result.content and len(result.content) > 0:
-                    text_content = result.content[0].text
-
-                    # Check if it's an error message
-                    if text_content.startswith("Error"):
-                        logger.error(f"MCP server returned error: {text_content}")
-                        raise RuntimeError(f"MCP server error: {text_content}")
-
-                    try:
-                        documents = json.loads(text_content)
-                        logger.info(f"MCP search returned {len(documents)} documents")
-                        return documents
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse MCP response as JSON: {text_content[:200]}")
-                        raise RuntimeError(f"Invalid JSON response from MCP server: {e}")
-                else:
-                    logger.warning("MCP search returned no content")
-                    return []
+        arguments = {"query": query, "return_type": return_type}
+        if self._closing is not None:
+            session = await self._get_session()
+            result = await session.call_tool("search_docs", arguments=arguments)
+        else:
+            async with stdio_client(self._server_params()) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    result = await session.call_tool(
+                        "search_docs", arguments=arguments
+                    )
+
+        # Parse the result - MCP returns TextContent
+        if result.content and len(result.content) > 0:
+            text_content = result.content[0].text
+
+            # Check if it's an error message
+            if text_content.startswith("Error"):
+                logger.error(f"MCP server returned error: {text_content}")
+                raise RuntimeError(f"MCP server error: {text_content}")
+
+            try:
+                documents = json.loads(text_content)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse MCP response as JSON: {text_content[:200]}")
+                raise RuntimeError(f"Invalid JSON response from MCP server: {e}")
+
+            logger.info(f"MCP search returned {len(documents)} documents")
+            try:
+                _write_cached_search(cache_path, documents)
+            except OSError as e:
+                logger.warning(f"Could not cache MCP search results: {e}")
+            return documents
+        else:
+            logger.warning("MCP search returned no content")
+            return []
@@ -6,18 +6,27 @@ Each function corresponds to a stage in the sequential pipeline process.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
+import asyncio
+import difflib
+import hashlib
 import logging
 import json
+import random
 import re
-from pydantic import TypeAdapter
+import tempfile
+import httpx
+import orjson
+from pydantic import TypeAdapter, ValidationError
+from pydantic_ai.exceptions import ModelHTTPError
 
-from .config import DOCS_BASE_PATH
+from .config import DOCS_BASE_PATH, DOC_WRITER_CACHE_DIR
 from .agents import (
+    CoordinatedEditInstructions,
     doc_instructor_agent,
     parse_doc_refs,
-    WeaviateDoc,
     doc_writer_agent,
+    DOC_WRITER_SYSTEM_PROMPT,
     DocOutput,
     pr_generator_agent,
     PRContent,
@@ -25,17 +34,78 @@ from .agents import (
 # Catalog functionality is now handled by weaviate-docs-mcp server
 import time
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime
 from rich.console import Console
 import git
 import os
 from github import Github
 
+if TYPE_CHECKING:
+    from .mcp_client import WeaviateDocsMCPClient
+
+
+# Serializes doc writer output straight to JSON, without intermediate dicts
+_doc_outputs_adapter = TypeAdapter(list[DocOutput])
+
+# Connection failures worth retrying. Provider SDKs wrap transport errors in
+# their own types, so those are added for whichever SDKs are installed.
+# asyncio.TimeoutError is only an alias of TimeoutError from Python 3.11.
+_TRANSIENT_CONNECTION_ERRORS: tuple[type[Exception], ...] = (
+    httpx.TransportError,
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+try:
+    from anthropic import APIConnectionError as _AnthropicConnectionError
+except ImportError:
+    pass
+else:
+    _TRANSIENT_CONNECTION_ERRORS += (_AnthropicConnectionError,)
+
+# Part of the doc writer cache key, so that changing the output models
+# invalidates cached responses
+_doc_outputs_schema = json.dumps(_doc_outputs_adapter.json_schema(), sort_keys=True)
+
+# Shared by every create_pr call rather than rebuilt per PR
+_console = Console()
+
+# Validates the instruction log before any writer calls are made
+_instructions_adapter = TypeAdapter(list[CoordinatedEditInstructions])
+
+# Searches currently awaiting the MCP server, keyed by query and cache mode,
+# so that concurrent identical searches share a single call
+_inflight_searches: Dict[tuple[str, bool], asyncio.Future] = {}
+
+
+async def _deduplicated_search(
+    mcp_client: "WeaviateDocsMCPClient", search_query: str, no_cache: bool = False
+) -> list[Dict[str, Any]]:
+    """Run an MCP search, joining an identical search if one is in flight."""
+    search_key = (search_query, no_cache)
+    inflight = _inflight_searches.get(search_key)
+    if inflight is not None:
+        logging.info("Joining in-flight MCP search for an identical query.")
+        return await asyncio.shield(inflight)
+
+    search = asyncio.ensure_future(
+        mcp_client.search_docs(search_query, no_cache=no_cache)
+    )
+    _inflight_searches[search_key] = search
+    try:
+        return await asyncio.shield(search)
+    finally:
+        _inflight_searches.pop(search_key, None)
+
 
 async def search_documents(
     feature_description: str,
     output_path: str = "outputs/doc_search_agent.log",
     catalog_path: str = "outputs/catalog.json",
+    mcp_client: "WeaviateDocsMCPClient" = None,
+    no_cache: bool = False,
 ) -> Dict[str, Any]:
     """
     Search for documents that may need editing for a given feature.
@@ -47,6 +117,9 @@ async def search_documents(
         feature_description: Description of the feature to search for
         output_path: Path to save the search results (default: "outputs/doc_search_agent.log")
         catalog_path: Path to catalog JSON (unused, kept for backward compatibility)
+        mcp_client: Client to reuse across calls (default: a new client per call)
+        no_cache: Always query the MCP server instead of reusing cached results.
+            Fresh results still replace the cached ones (default: False)
 
     Returns:
         Dict containing search results with keys:
@@ -59,9 +132,10 @@ async def search_documents(
     from .mcp_client import WeaviateDocsMCPClient
 
     # Use MCP client to search documents
-    mcp_client = WeaviateDocsMCPClient()
+    if mcp_client is None:
+        mcp_client = WeaviateDocsMCPClient()
     search_query = f"Find documents that may need editing for this feature: {feature_description}"
-    documents = await mcp_client.search_docs(search_query)
+    documents = await _deduplicated_search(mcp_client, search_query, no_cache)
 
     # Convert MCP results to the format expected by downstream pipeline
     # MCP returns full documents with {path, content, referenced_files}
@@ -75,8 +149,8 @@ async def search_documents(
 
     # Save output for pipeline continuity
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=4)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logging.info(
         f"Document search complete via MCP. Found {len(results)} documents. Results saved to {output_path}"
@@ -115,44 +189,57 @@ async def coordinate_changes(
     logging.info(f"Starting change coordination for feature: {feature_description}")
 
     # Load search results
-    with open(search_results_path, "r") as f:
-        doc_search_results = json.load(f)
+    with open(search_results_path, "rb") as f:
+        doc_search_results = orjson.loads(f.read())
 
     logging.info(f"Found {len(doc_search_results)} search results to process.")
 
     # Collect and format all docs and their references
     prompt_docs_list = []
     all_docs_content = {}  # Use a dict to avoid processing the same file twice
+    parsed_paths = set()
 
-    def add_doc_to_prompt(doc: WeaviateDoc, is_main: bool):
-        if doc.path in all_docs_content or not doc.doc_body:
-            return  # Skip if already processed or empty
-
-        all_docs_content[doc.path] = doc.doc_body
-        doc_type = "MAIN FILE" if is_main else "REFERENCED FILE"
-        prompt_docs_list.append(
-            f"[{doc_type}]\n"
-            f"Filepath: {doc.path}\n"
-            f"====== START-ORIGINAL CONTENT =====\n{doc.doc_body}\n====== END-ORIGINAL CONTENT =====\n"
-        )
-
+    full_paths = []
     for result in doc_search_results:
         filepath = result.get("path")
         if not filepath:
             logging.warning(f"Skipping search result due to missing path: {result}")
             continue
 
-        logging.info(f"Parsing document and its references: {filepath}")
         # Resolve path relative to DOCS_BASE_PATH
         full_path = Path(DOCS_BASE_PATH) / filepath
-        doc_bundle = parse_doc_refs(full_path, include_code_body=False)
+        if full_path in parsed_paths:
+            continue  # Duplicate search hit; its references are already collected
+        parsed_paths.add(full_path)
+        full_paths.append(full_path)
+
+        logging.info(f"Parsing document and its references: {filepath}")
+
+    # Parse documents in worker threads so their file reads overlap; gather
+    # keeps the bundles in search result order
+    doc_bundles = await asyncio.gather(
+        *(
+            asyncio.to_thread(parse_doc_refs, full_path, include_code_body=False)
+            for full_path in full_paths
+        )
+    )
 
-        # Add main document
-        add_doc_to_prompt(doc_bundle, is_main=True)
+    for doc_bundle in doc_bundles:
+        # Add main document, then only first-level references
+        docs_to_add = chain(
+            [(doc_bundle, "MAIN FILE")],
+            ((ref_doc, "REFERENCED FILE") for ref_doc in doc_bundle.referenced_docs),
+        )
+        for doc, doc_type in docs_to_add:
+            if doc.path in all_docs_content or not doc.doc_body:
+                continue  # Skip if already processed or empty
 
-        # Add only first-level references
-        for ref_doc in doc_bundle.referenced_docs:
-            add_doc_to_prompt(ref_doc, is_main=False)
+            all_docs_content[doc.path] = doc.doc_body
+            prompt_docs_list.append(
+                f"[{doc_type}]\n"
+                f"Filepath: {doc.path}\n"
+                f"====== START-ORIGINAL CONTENT =====\n{doc.doc_body}\n====== END-ORIGINAL CONTENT =====\n"
+            )
 
     document_bundle_prompt = "\n".join(prompt_docs_list)
 
@@ -179,10 +266,12 @@ async def coordinate_changes(
     logging.info(f"Token usage for doc_instructor_agent: {response.usage()}")
 
     # Save instructions
-    instructions = [inst.model_dump() for inst in response.output]
+    instructions = [
+        inst.model_dump(mode="json") for inst in response.output
+    ]
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(instructions, f, indent=4)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(instructions, option=orjson.OPT_INDENT_2))
 
     logging.info(
         f"Change coordination complete. Generated {len(instructions)} instructions. Saved to {output_path}"
@@ -248,24 +337,217 @@ def _validate_and_log_edit(edit: dict, file_path: str) -> None:
         )
 
 
+def _is_transient_error(error: Exception) -> bool:
+    """Whether a failed agent call is worth retrying: rate limits, server errors and dropped connections."""
+    if isinstance(error, ModelHTTPError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, _TRANSIENT_CONNECTION_ERRORS)
+
+
+async def _run_with_backoff(agent, prompt: str, max_attempts: int = 5):
+    """Run an agent, retrying transient failures with exponential backoff and jitter.
+
+    Backoff keeps concurrent bundles from failing outright when the provider
+    starts rate limiting. Other errors, such as bad requests or invalid output,
+    would fail again on retry and are raised immediately.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await agent.run(prompt)
+        except Exception as e:
+            if attempt == max_attempts or not _is_transient_error(e):
+                raise
+            delay = 2 ** (attempt - 1) + random.random()
+            logging.warning(
+                f"Agent call failed (attempt {attempt}/{max_attempts}): {e}. Retrying in {delay:.1f}s."
+            )
+            await asyncio.sleep(delay)
+
+
+def _iter_file_edits(doc_output: dict):
+    """Yield (path, edits) for a writer output's own file and its referenced files."""
+    if doc_output.get("edits"):
+        yield doc_output["path"], doc_output["edits"]
+    for path, ref_edits in doc_output.get("referenced_file_edits", {}).items():
+        if ref_edits:
+            yield path, ref_edits
+
+
+def _apply_line_edits(path: str, lines: list[str], edits: list[dict]) -> list[str]:
+    """Apply line-based edits to a document in a single pass.
+
+    Line numbers in every edit refer to the original document, so the edits are
+    spliced in ascending order instead of being applied one by one, which would
+    shift the whole list on every edit. Edits overlapping an earlier one are
+    skipped.
+    """
+    # For insertions (ADD_NEW, ENHANCE), the intent is to insert text *before*
+    # the specified start_line without deleting the line itself. Insertions are
+    # therefore ordered before a replacement starting on the same line.
+    def is_insertion(edit: dict) -> bool:
+        return edit.get("edit_type") in ["add_new", "enhance"]
+
+    # Writers sometimes repeat an edit verbatim; a repeated insertion would
+    # otherwise be inserted twice
+    unique_edits = {
+        (e["start_line"], e["end_line"], e.get("edit_type"), e["replacement_txt"]): e
+        for e in edits
+    }
+    edits = sorted(
+        unique_edits.values(), key=lambda e: (e["start_line"], not is_insertion(e))
+    )
+
+    new_lines = []
+    cursor = 0  # Index of the first original line not yet copied
+    for edit in edits:
+        start_line = edit["start_line"]
+        end_line = edit["end_line"]
+        comment = edit.get("comment", "No comment")
+
+        # Adjust for 0-based indexing. end_line is inclusive.
+        start_idx = start_line - 1
+        end_idx = start_idx if is_insertion(edit) else end_line
+
+        # Handle invalid line numbers
+        if (
+            start_idx < 0
+            or start_idx > len(lines)
+            or end_idx < start_idx
+            or end_idx > len(lines)
+        ):
+            logging.warning(
+                f"Invalid line numbers for edit in {path}: start={start_line}, end={end_line}. Skipping."
+            )
+            continue
+        if start_idx < cursor:
+            logging.warning(
+                f"Edit in {path} at lines {start_line}-{end_line} overlaps a previous edit. Skipping."
+            )
+            continue
+
+        logging.info(
+            f"Applying edit to {path} at lines {start_line}-{end_line}: {comment}"
+        )
+        new_lines.extend(lines[cursor:start_idx])
+        new_lines.extend(edit["replacement_txt"].splitlines())
+        cursor = end_idx
+
+    new_lines.extend(lines[cursor:])
+    return new_lines
+
+
+@lru_cache(maxsize=256)
+def _number_lines(content: str) -> str:
+    """Prefix each line with its 1-based line number, as shown to the writer agent.
+
+    Cached on the content itself, so a file shared by several bundles is only
+    renumbered after it has actually been edited.
+    """
+    return "\n".join(f"{i+1}|{line}" for i, line in enumerate(content.splitlines()))
+
+
+def _doc_writer_cache_path(prompt: str) -> Path:
+    """Path of the cached doc writer response for a prompt.
+
+    The model name and settings, system prompt and output schema are part of
+    the key, so changing any of them does not reuse responses made under the
+    old ones.
+    """
+    key_parts = [
+        doc_writer_agent.model.model_name,
+        json.dumps(doc_writer_agent.model_settings, sort_keys=True, default=str),
+        DOC_WRITER_SYSTEM_PROMPT,
+        _doc_outputs_schema,
+        prompt,
+    ]
+    key = hashlib.sha256("\0".join(key_parts).encode()).hexdigest()
+    return Path(DOC_WRITER_CACHE_DIR) / f"{key}.json"
+
+
+def _read_cached_doc_outputs(cache_path: Path) -> list[DocOutput] | None:
+    """Return a cached doc writer response, or None if missing or unreadable."""
+    try:
+        return _doc_outputs_adapter.validate_json(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        logging.warning(f"Ignoring unreadable doc writer cache entry {cache_path}: {e}")
+        return None
+
+
+def _write_cached_doc_outputs(cache_path: Path, doc_outputs: list[DocOutput]) -> None:
+    """Cache a doc writer response, replacing the entry atomically.
+
+    Writing to a temporary file first means an interrupted run never leaves a
+    truncated entry behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_doc_outputs_adapter.dump_json(doc_outputs))
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_doc_file(path_str: str) -> tuple[str, str] | None:
+    """Read a documentation file, trying the path as given and under docs/."""
+    path = Path(path_str)
+    if not path.is_file():
+        path = Path("docs") / path_str
+    if not path.is_file():
+        logging.warning(f"Could not find file: {path_str} or docs/{path_str}, skipping.")
+        return None
+    return path.as_posix(), path.read_text(encoding="utf-8")
+
+
+def _bundle_paths(instruction_bundle: dict) -> set[str]:
+    """Return the primary path and all instructed paths of a bundle."""
+    bundle_paths = {instruction_bundle["primary_path"]}
+    for instr in instruction_bundle["file_instructions"]:
+        bundle_paths.add(instr["path"])
+    return bundle_paths
+
+
+def _resolve_content_path(path_str: str, contents: Dict[str, str]) -> str | None:
+    """Resolve a path to its key in contents, trying both original and docs-prefixed versions."""
+    if path_str in contents:
+        return path_str
+    prefixed_path = (Path("docs") / path_str).as_posix()
+    if prefixed_path in contents:
+        return prefixed_path
+    return None
+
+
 async def make_changes(
     feature_description: str,
     instructions_path: str = "outputs/doc_instructor_agent.log",
     output_path: str = "outputs/doc_writer_agent.log",
     edits_path: str = "outputs/doc_writer_agent_edits.log",
+    max_concurrency: int = 8,
+    no_cache: bool = False,
+    writer_semaphore: asyncio.Semaphore | None = None,
 ) -> Dict[str, Any]:
     """
     Apply editing instructions to generate revised documents.
 
     This operation processes the coordination instructions and uses the doc writer agent
     to generate actual document changes. Edits are applied cumulatively if multiple
-    instructions touch the same file.
+    instructions touch the same file; bundles that touch disjoint files are processed
+    concurrently.
 
     Args:
         feature_description: Description of the feature for context
         instructions_path: Path to the instructions file (default: "outputs/doc_instructor_agent.log")
         output_path: Path to save revised documents (default: "outputs/doc_writer_agent.log")
-        edits_path: Path to save raw edits (default: "outputs/doc_writer_agent_edits.log")
+        edits_path: Path to stream raw edits to as JSON Lines (default: "outputs/doc_writer_agent_edits.log")
+        max_concurrency: Maximum number of doc writer agent calls in flight (default: 8)
+        no_cache: Always call the doc writer instead of reusing cached responses.
+            Fresh responses still replace the cached ones (default: False)
+        writer_semaphore: Semaphore limiting doc writer calls, to share one limit
+            across concurrent make_changes calls. Overrides max_concurrency
+            (default: a new semaphore of max_concurrency)
 
     Returns:
         Dict containing results with keys:
@@ -273,57 +555,119 @@ async def make_changes(
         - files_changed: Number of files that were changed
         - total_processing_time: Total time taken in seconds
     """
+    if writer_semaphore is None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
     logging.info("Starting to make changes to the documentation.")
     start_time = time.time()
 
-    with open(instructions_path, "r") as f:
-        doc_instructions = json.load(f)
+    with open(instructions_path, "rb") as f:
+        doc_instructions = orjson.loads(f.read())
+    # Fail fast on a malformed instruction log, before any writer calls
+    _instructions_adapter.validate_python(doc_instructions)
 
     logging.info(f"Found {len(doc_instructions)} instruction bundles to process.")
 
+    # Create output directories once, rather than before every write
+    output_dir = Path(output_path).parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    Path(edits_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(DOC_WRITER_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+
     # Collect all file paths from all bundles and load their original content
     all_paths = set()
     for instruction_bundle in doc_instructions:
-        all_paths.add(instruction_bundle["primary_path"])
-        for instr in instruction_bundle["file_instructions"]:
-            all_paths.add(instr["path"])
+        all_paths |= _bundle_paths(instruction_bundle)
 
-    original_contents = {}
-    for path_str in all_paths:
-        path = Path(path_str)
-        if not path.is_file():
-            path = Path("docs") / path_str
-        if not path.is_file():
-            logging.warning(
-                f"Could not find file: {path_str} or docs/{path_str}, skipping."
-            )
-            continue
-        original_contents[path.as_posix()] = path.read_text()
+    # Read all files off the event loop, concurrently
+    read_results = await asyncio.gather(
+        *(asyncio.to_thread(_read_doc_file, path_str) for path_str in all_paths)
+    )
+    original_contents = dict(result for result in read_results if result)
+
+    # A bundle whose primary file is missing can't be edited, so drop it up
+    # front rather than paying for a writer call
+    missing_primary_paths = [
+        instruction_bundle["primary_path"]
+        for instruction_bundle in doc_instructions
+        if not _resolve_content_path(instruction_bundle["primary_path"], original_contents)
+    ]
+    if missing_primary_paths:
+        logging.warning(
+            f"Skipping {len(missing_primary_paths)} instruction bundles with missing primary files: {missing_primary_paths}"
+        )
+        doc_instructions = [
+            instruction_bundle
+            for instruction_bundle in doc_instructions
+            if _resolve_content_path(instruction_bundle["primary_path"], original_contents)
+        ]
 
     revised_contents = original_contents.copy()
-    all_raw_edits = []
 
-    for instruction_bundle in doc_instructions:
+    # Bundles that touch the same file must run in their original order, since
+    # each is prompted with (and numbers its lines against) the edits made by
+    # the ones before it. Bundles on disjoint files run concurrently.
+    bundle_dependencies = []
+    last_bundle_for_path = {}
+    for i, instruction_bundle in enumerate(doc_instructions):
+        dependencies = set()
+        for path_str in _bundle_paths(instruction_bundle):
+            key = _resolve_content_path(path_str, original_contents) or path_str
+            if key in last_bundle_for_path:
+                dependencies.add(last_bundle_for_path[key])
+            last_bundle_for_path[key] = i
+        bundle_dependencies.append(dependencies)
+
+    # The feature description is shared by every bundle, so its part of the
+    # prompt is built once
+    prompt_header = f"""
+        Update the documentation for a new Weaviate feature.
+
+        # Feature Description
+        {feature_description}
+"""
+
+    bundle_done = [asyncio.Event() for _ in doc_instructions]
+    semaphore = (
+        writer_semaphore
+        if writer_semaphore is not None
+        else asyncio.Semaphore(max_concurrency)
+    )
+
+    async def process_bundle(i: int, instruction_bundle: dict) -> tuple[int, list]:
+        for dependency in bundle_dependencies[i]:
+            await bundle_done[dependency].wait()
+        try:
+            async with semaphore:
+                return i, await apply_bundle(instruction_bundle)
+        except Exception:
+            # One bad bundle must not abort the others, which would otherwise
+            # keep running unawaited while the revised documents go unlogged
+            logging.exception(
+                f"Failed to apply instructions for primary file: {instruction_bundle['primary_path']}"
+            )
+            return i, []  # Skip this bundle
+        finally:
+            bundle_done[i].set()
+
+    async def apply_bundle(instruction_bundle: dict) -> list:
         primary_path = instruction_bundle["primary_path"]
         file_instructions = instruction_bundle["file_instructions"]
 
-        bundle_paths = {primary_path}
-        for instr in file_instructions:
-            bundle_paths.add(instr["path"])
+        # Nothing for the writer to do, so don't pay for a call
+        if not any(instr["instructions"].strip() for instr in file_instructions):
+            logging.info(f"No instructions for {primary_path}, skipping doc writer.")
+            return []
 
         prompt_docs_list = []
         bundle_contents = {}
 
-        for path_str in bundle_paths:
-            # Resolve path, trying both original and docs-prefixed versions
-            canonical_path = None
-            if path_str in revised_contents:
-                canonical_path = path_str
-            else:
-                prefixed_path = (Path("docs") / path_str).as_posix()
-                if prefixed_path in revised_contents:
-                    canonical_path = prefixed_path
-
+        # Primary file first, then the rest sorted, so that identical bundle
+        # memberships produce identical prompts
+        for path_str in sorted(
+            _bundle_paths(instruction_bundle), key=lambda p: (p != primary_path, p)
+        ):
+            canonical_path = _resolve_content_path(path_str, revised_contents)
             if not canonical_path:
                 logging.warning(
                     f"Content for {path_str} not found in revised_contents, skipping from bundle."
@@ -333,10 +677,7 @@ async def make_changes(
             content = revised_contents[canonical_path]
             bundle_contents[canonical_path] = content
 
-            lines = content.splitlines()
-            numbered_content = "\n".join(
-                f"{i+1}|{line}" for i, line in enumerate(lines)
-            )
+            numbered_content = _number_lines(content)
             doc_type = "MAIN FILE" if path_str == primary_path else "REFERENCED FILE"
             prompt_docs_list.append(
                 f"## File: {canonical_path} ({doc_type})\n{numbered_content}\n"
@@ -352,81 +693,87 @@ async def make_changes(
             )
         instructions_prompt = "\n---\n".join(formatted_instructions)
 
-        prompt = f"""
-        Update the documentation for a new Weaviate feature.
-
-        # Feature Description
-        {feature_description}
-
+        prompt = "".join(
+            [
+                prompt_header,
+                f"""
         # Documentation Files
         {prompt_docs}
 
         # Update Instructions
         {instructions_prompt}
-        """
+        """,
+            ]
+        )
 
         bundle_start_time = time.time()
         logging.info(f"Processing instructions for primary file: {primary_path}")
 
-        try:
-            response = await doc_writer_agent.run(prompt)
-        except Exception as e:
-            logging.error(f"Agent failed for primary_path {primary_path} after retries: {e}")
-            continue # Skip to the next bundle
-
-        logging.info(
-            f"Token usage for doc_writer_agent (primary_path: {primary_path}): {response.usage()}"
+        # Identical prompts (same feature, documents and instructions) reuse the
+        # response from a previous run instead of calling the agent again
+        cache_path = _doc_writer_cache_path(prompt)
+        parsed_output = (
+            None
+            if no_cache
+            else await asyncio.to_thread(_read_cached_doc_outputs, cache_path)
         )
+        if parsed_output is not None:
+            logging.info(f"Using cached doc_writer_agent output for {primary_path}")
+        else:
+            try:
+                response = await _run_with_backoff(doc_writer_agent, prompt)
+            except Exception as e:
+                logging.error(f"Agent failed for primary_path {primary_path} after retries: {e}")
+                return []  # Skip this bundle
+
+            logging.info(
+                f"Token usage for doc_writer_agent (primary_path: {primary_path}): {response.usage()}"
+            )
 
-        # The agent now returns a list of DocOutput objects directly
-        parsed_output = response.output
+            # The agent now returns a list of DocOutput objects directly
+            parsed_output = response.output
+            try:
+                await asyncio.to_thread(
+                    _write_cached_doc_outputs, cache_path, parsed_output
+                )
+            except OSError as e:
+                logging.warning(f"Could not cache doc_writer_agent output for {primary_path}: {e}")
 
         # Save parsed output for debugging
-        output_dir = Path(output_path).parent
         debug_output_path = (
             output_dir / f"doc_writer_agent_raw_output_{Path(primary_path).stem}.log"
         )
-        debug_output_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            output_for_log = [o.model_dump() for o in parsed_output]
-            with open(debug_output_path, "w") as f:
-                json.dump(output_for_log, f, indent=4)
+            with open(debug_output_path, "wb") as f:
+                f.write(_doc_outputs_adapter.dump_json(parsed_output, indent=2))
             logging.info(f"Saved parsed agent output to {debug_output_path}")
         except Exception as e:
             logging.error(f"Could not serialize agent output for logging: {e}")
 
 
         try:
-            all_edits = [o.model_dump() for o in parsed_output]
+            all_edits = [
+                o.model_dump(mode="json") for o in parsed_output
+            ]
 
-            # Validate and flag suspicious edits
+            # Validate and flag suspicious edits, grouping them by file path
+            edits_by_file = defaultdict(list)
             for doc_output in all_edits:
-                file_path = doc_output["path"]
-                for edit in doc_output.get("edits", []):
-                    _validate_and_log_edit(edit, file_path)
-                for ref_path, ref_edits in doc_output.get("referenced_file_edits", {}).items():
-                    for edit in ref_edits:
-                        _validate_and_log_edit(edit, ref_path)
-
-            all_raw_edits.extend(all_edits)
+                for path, edits in _iter_file_edits(doc_output):
+                    for edit in edits:
+                        _validate_and_log_edit(edit, path)
+                    edits_by_file[path].extend(edits)
+
         except Exception as e:
             logging.error(
                 f"Failed to process doc_writer_agent output for {primary_path}: {e}"
             )
             logging.error(f"Parsed output was: \n{parsed_output}")
-            continue  # Continue to the next instruction bundle
-
-        # Group all edits by file path
-        edits_by_file = defaultdict(list)
-        for doc_output in all_edits:
-            if doc_output.get("edits"):
-                edits_by_file[doc_output["path"]].extend(doc_output["edits"])
-            for path, ref_edits in doc_output.get(
-                "referenced_file_edits", {}
-            ).items():
-                edits_by_file[path].extend(ref_edits)
-
-        # Apply edits to all files using a line-based method
+            return []  # Skip this bundle
+
+        # Apply edits to all files using a line-based method. Results are
+        # committed together, so a failing edit leaves no file half-updated
+        bundle_revisions = {}
         for path, edits in edits_by_file.items():
             content_to_edit = revised_contents.get(path)
             if content_to_edit is None:
@@ -435,77 +782,54 @@ async def make_changes(
                 )
                 continue
 
-            lines = content_to_edit.splitlines()
-
-            # Sort edits by start_line in reverse order to avoid index shifting issues
-            edits.sort(key=lambda e: e["start_line"], reverse=True)
-
-            for edit in edits:
-                start_line = edit["start_line"]
-                end_line = edit["end_line"]
-                replacement_txt = edit["replacement_txt"]
-                comment = edit.get("comment", "No comment")
-
-                logging.info(
-                    f"Applying edit to {path} at lines {start_line}-{end_line}: {comment}"
-                )
-
-                # Adjust for 0-based indexing. end_line is inclusive.
-                start_idx = start_line - 1
-
-                # For insertions (ADD_NEW, ENHANCE), the intent is to insert text *before*
-                # the specified start_line without deleting the line itself. To achieve this,
-                # the slice should be empty (e.g., lines[i:i]).
-                # For replacements and deletions, the slice should include the lines
-                # from start_line to end_line.
-                edit_type = edit.get("edit_type")
-                is_insertion = edit_type in ["add_new", "enhance"]
-
-                if is_insertion:
-                    end_idx = start_idx  # Creates an empty slice for insertion
-                else:
-                    end_idx = end_line  # Creates a slice for replacement/deletion
-
-                # Handle invalid line numbers
-                if (
-                    start_idx < 0
-                    or start_idx > len(lines)
-                    or end_idx < start_idx
-                    or end_idx > len(lines)
-                ):
-                    logging.warning(
-                        f"Invalid line numbers for edit in {path}: start={start_line}, end={end_line}. Skipping."
-                    )
-                    continue
-
-                replacement_lines = replacement_txt.splitlines()
-                lines[start_idx:end_idx] = replacement_lines
+            lines = _apply_line_edits(path, content_to_edit.splitlines(), edits)
 
             # Clean trailing whitespace from all lines before saving
             cleaned_lines = [line.rstrip() for line in lines]
-            revised_contents[path] = "\n".join(cleaned_lines)
+            bundle_revisions[path] = "\n".join(cleaned_lines)
+        revised_contents.update(bundle_revisions)
 
         bundle_end_time = time.time()
         logging.info(
             f"Finished processing instructions for primary file: {primary_path} in {bundle_end_time - bundle_start_time:.2f} seconds."
         )
 
+        return all_edits
+
+    bundle_tasks = [
+        process_bundle(i, instruction_bundle)
+        for i, instruction_bundle in enumerate(doc_instructions)
+    ]
+    # Raw edits are streamed to disk as JSON Lines in the original bundle
+    # order, each bundle being written as soon as all bundles before it have
+    # completed, rather than being held in memory until the end
+    pending_edits = {}
+    next_to_write = 0
+    with open(edits_path, "wb") as edits_file:
+        for completed, next_finished in enumerate(
+            asyncio.as_completed(bundle_tasks), 1
+        ):
+            i, bundle_edits = await next_finished
+            pending_edits[i] = bundle_edits
+            while next_to_write in pending_edits:
+                for doc_output in pending_edits.pop(next_to_write):
+                    edits_file.write(orjson.dumps(doc_output, option=orjson.OPT_APPEND_NEWLINE))
+                next_to_write += 1
+            edits_file.flush()
+            logging.info(
+                f"Completed {completed}/{len(bundle_tasks)} instruction bundles."
+            )
+    logging.info(f"Raw edits from agent logged to {edits_path}")
+
     # After processing all bundles, determine the final set of changed documents
     revised_docs_to_log = []
     for path, content in revised_contents.items():
         if original_contents.get(path) != content:
             revised_docs_to_log.append({"path": path, "revised_doc": content})
 
-    # Save raw edits
-    Path(edits_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(edits_path, "w") as f:
-        json.dump(all_raw_edits, f, indent=4)
-    logging.info(f"Raw edits from agent logged to {edits_path}")
-
     # Save revised documents
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(revised_docs_to_log, f, indent=4)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(revised_docs_to_log, option=orjson.OPT_INDENT_2))
 
     end_time = time.time()
     total_time = end_time - start_time
@@ -524,10 +848,54 @@ async def make_changes(
 
 
 
+def _docs_repo_path(file_path_str: str, docs_path: str) -> str | None:
+    """Path of a changed file relative to the docs repo, or None if it lies outside it.
+
+    Both sides are resolved, so a symlinked or absolute docs path still matches.
+    """
+    try:
+        return (
+            Path(file_path_str).resolve().relative_to(Path(docs_path).resolve()).as_posix()
+        )
+    except ValueError:
+        return None
+
+
+def _diff_change(
+    change: dict, docs_path: str, original_contents: Dict[str, str] | None
+) -> str:
+    """Unified diff of a revised document against its original, or "" if unchanged."""
+    file_path_str = change["path"]
+    # Changes outside the docs repo are never applied, so there is nothing to diff
+    if _docs_repo_path(file_path_str, docs_path) is None:
+        return ""
+    file_path = Path(file_path_str)
+    if original_contents is not None and file_path_str in original_contents:
+        original_content = original_contents[file_path_str]
+    elif file_path.exists():
+        original_content = file_path.read_text(encoding="utf-8")
+    else:
+        original_content = ""
+
+    revised_content = change["revised_doc"]
+    # Nothing to diff, so skip splitting both documents into lines
+    if original_content == revised_content:
+        return ""
+    return "".join(
+        difflib.unified_diff(
+            original_content.splitlines(keepends=True),
+            revised_content.splitlines(keepends=True),
+            fromfile=f"a/{file_path_str}",
+            tofile=f"b/{file_path_str}",
+        )
+    )
+
+
 async def generate_pr_content(
     feature_description: str,
     changes_path: str = "outputs/doc_writer_agent.log",
     docs_path: str = "docs",
+    original_contents: Dict[str, str] = None,
 ) -> PRContent:
     """
     Generate PR title and description using LLM based on the changes made.
@@ -536,6 +904,8 @@ async def generate_pr_content(
         feature_description: Description of the feature that was implemented
         changes_path: Path to the revised documents file
         docs_path: Path to the docs repository for generating diffs
+        original_contents: Original document contents keyed by changed path, if
+            already read. Files not listed are read from disk.
 
     Returns:
         PRContent object with generated title and description
@@ -543,14 +913,10 @@ async def generate_pr_content(
     logging.info("Generating PR content using LLM...")
 
     # Load the changes made
-    import difflib
-    from pathlib import Path
-    import json
-
     changes_data = []
     if Path(changes_path).exists():
-        with open(changes_path, "r") as f:
-            changes_data = json.load(f)
+        with open(changes_path, "rb") as f:
+            changes_data = orjson.loads(f.read())
 
     if not changes_data:
         # Fallback for no changes
@@ -560,27 +926,14 @@ async def generate_pr_content(
             description="This PR contains automated documentation improvements generated by DocWeaver.",
         )
 
-    # Generate diffs to provide concise context to the LLM
-    diffs = []
-    for change in changes_data:
-        file_path_str = change["path"]
-        # The path in the change log is relative to the docs/ dir, but when applying changes,
-        # we need to make sure we're inside docs/
-        file_path = Path(docs_path) / Path(file_path_str).relative_to(Path(docs_path))
-        original_content = ""
-        if file_path.exists():
-            original_content = file_path.read_text()
-
-        revised_content = change["revised_doc"]
-        diff = "".join(
-            difflib.unified_diff(
-                original_content.splitlines(keepends=True),
-                revised_content.splitlines(keepends=True),
-                fromfile=f"a/{file_path_str}",
-                tofile=f"b/{file_path_str}",
-            )
+    # Generate diffs to provide concise context to the LLM. Reads and diffs run
+    # in worker threads; gather keeps them in change log order
+    diffs = await asyncio.gather(
+        *(
+            asyncio.to_thread(_diff_change, change, docs_path, original_contents)
+            for change in changes_data
         )
-        diffs.append(diff)
+    )
 
     diff_summary = "\n".join(filter(None, diffs))
 
@@ -616,6 +969,16 @@ async def generate_pr_content(
         )
 
 
+@lru_cache(maxsize=1)
+def _github_client(token: str) -> Github:
+    """GitHub client shared by every PR created in this process.
+
+    Reusing it keeps its HTTP session, and so the TLS connection, alive between
+    tasks.
+    """
+    return Github(token)
+
+
 async def create_pr(
     feature_description: str = None,
     task_name: str = None,
@@ -647,17 +1010,16 @@ async def create_pr(
         - success: Whether the operation succeeded
     """
     logging.info("Creating pull request with changes.")
-    console = Console()
 
     # Load changes
     if not Path(changes_path).exists():
         raise FileNotFoundError(f"No changes log found at {changes_path}")
 
-    with open(changes_path, "r") as f:
-        proposed_changes = json.load(f)
+    with open(changes_path, "rb") as f:
+        proposed_changes = orjson.loads(f.read())
 
     if not proposed_changes:
-        console.print("✅ No changes found in log, skipping PR creation.")
+        _console.print("✅ No changes found in log, skipping PR creation.")
         return {"success": False, "message": "No changes to apply"}
 
     # Work in the docs directory
@@ -668,24 +1030,39 @@ async def create_pr(
     repo = git.Repo(docs_path_obj)
     original_branch = repo.active_branch
     changes_applied = False
+    # Read each original once, before it is overwritten, so the PR content
+    # can be generated from real diffs without reading the files again
+    original_contents = {}
+    # Paths relative to the docs repo, so only these files are staged
+    changed_paths = []
     try:
         # Overwrite files with their revised content
         for change in proposed_changes:
             file_path_str = change["path"]
+            repo_path = _docs_repo_path(file_path_str, docs_path)
+            if repo_path is None:
+                logging.warning(
+                    f"Skipping change to {file_path_str}, which is outside the docs repo at {docs_path}."
+                )
+                continue
             file_path = Path(file_path_str)
+            original_contents[file_path_str] = (
+                file_path.read_text(encoding="utf-8") if file_path.exists() else ""
+            )
 
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write the revised document content
-            with open(file_path, "w") as f:
+            with open(file_path, "w", encoding="utf-8") as f:
                 f.write(change["revised_doc"])
 
-            console.print(f"✅ Changes for {file_path_str} written to disk.")
+            _console.print(f"✅ Changes for {file_path_str} written to disk.")
+            changed_paths.append(repo_path)
             changes_applied = True
 
         if not changes_applied:
-            console.print("✅ No changes to apply, skipping.")
+            _console.print("✅ No changes to apply, skipping.")
             return {"success": False, "message": "No changes to apply"}
 
         # Get GitHub token
@@ -715,26 +1092,30 @@ async def create_pr(
 
         # Create and checkout new branch
         if branch_name in repo.heads:
-            console.print(f"Branch '{branch_name}' already exists. Recreating it.")
+            _console.print(f"Branch '{branch_name}' already exists. Recreating it.")
             repo.delete_head(branch_name, force=True)
 
         new_branch = repo.create_head(branch_name)
         new_branch.checkout()
 
-        # Stage and commit changes
-        repo.git.add(".")
+        # Stage and commit the changed files only, rather than walking the
+        # whole docs working tree
+        repo.index.add(changed_paths)
 
-        if not repo.is_dirty() and not repo.untracked_files:
-            console.print("⚠️  No changes to commit")
+        if not repo.index.diff("HEAD"):
+            _console.print("⚠️  No changes to commit")
             return {"success": False, "message": "No changes to commit"}
 
         # Generate title and body if not provided
         if title is None or body is None:
             if feature_description and (body is None):
                 # Use LLM to generate PR content
-                console.print("🤖 Generating PR title and description using LLM...")
+                _console.print("🤖 Generating PR title and description using LLM...")
                 pr_content = await generate_pr_content(
-                    feature_description, changes_path, docs_path=docs_path
+                    feature_description,
+                    changes_path,
+                    docs_path=docs_path,
+                    original_contents=original_contents,
                 )
 
                 llm_description = pr_content.description
@@ -767,7 +1148,7 @@ async def create_pr(
         repo.index.commit(title)
         repo.remotes.origin.push(new_branch)
 
-        console.print(f"✅ Branch '{branch_name}' created and pushed")
+        _console.print(f"✅ Branch '{branch_name}' created and pushed")
         logging.info(f"Created branch '{branch_name}' with changes")
 
         # Create Pull Request
@@ -779,7 +1160,7 @@ async def create_pr(
             )
         repo_owner, repo_name = match.groups()
 
-        g = Github(github_token)
+        g = _github_client(github_token)
         gh_repo = g.get_repo(f"{repo_owner}/{repo_name}")
 
         # Get default branch from remote 'origin'
@@ -793,7 +1174,7 @@ async def create_pr(
             draft=True,
         )
 
-        console.print(f"✅ Draft pull request created: {pull.html_url}")
+        _console.print(f"✅ Draft pull request created: {pull.html_url}")
 
         return {
             "success": True,
@@ -812,11 +1193,11 @@ async def create_pr(
             # Use git checkout and clean to reset the state
             repo.git.checkout(original_branch.name, "--force")
             repo.git.clean("-fd")
-            console.print(
+            _console.print(
                 f"✅ Switched back to original branch: {original_branch.name} and cleaned worktree."
             )
         except Exception as e:
-            console.print(f"⚠️ Could not switch back to original branch: {e}")
+            _console.print(f"⚠️ Could not switch back to original branch: {e}")
 
 
 # Catalog update functionality has been moved to weaviate-docs-mcp/update_catalog.py
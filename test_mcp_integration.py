@@ -25,7 +25,8 @@ async def main():
     print("-" * 60)
 
     try:
-        results = await client.search_docs(query)
+        # Bypass the search cache, so the check always reaches the server
+        results = await client.search_docs(query, no_cache=True)
         print(f"\nFound {len(results)} documents:")
         print("-" * 60)
 
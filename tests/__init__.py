@@ -0,0 +1,11 @@
+import os
+import sys
+from pathlib import Path
+
+# The package lives under src/, and agents.py imports helpers.py from the root
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+# Agents are built at import time and need a key, though no test calls the API
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
@@ -0,0 +1,106 @@
+"""Tests for the single-pass edit splicer in the doc writer stage."""
+
+import random
+import unittest
+
+from docweaver.pipeline import _apply_line_edits
+
+
+def edit(start_line, end_line, replacement_txt, edit_type="update_outdated"):
+    return {
+        "start_line": start_line,
+        "end_line": end_line,
+        "replacement_txt": replacement_txt,
+        "edit_type": edit_type,
+    }
+
+
+def apply_one_by_one(lines, edits):
+    """The original algorithm: apply edits bottom-up, one slice assignment each."""
+    lines = list(lines)
+    for e in sorted(edits, key=lambda e: e["start_line"], reverse=True):
+        start_idx = e["start_line"] - 1
+        if e["edit_type"] in ["add_new", "enhance"]:
+            end_idx = start_idx
+        else:
+            end_idx = e["end_line"]
+        if start_idx < 0 or start_idx > len(lines) or end_idx < start_idx or end_idx > len(lines):
+            continue
+        lines[start_idx:end_idx] = e["replacement_txt"].splitlines()
+    return lines
+
+
+class ApplyLineEditsTest(unittest.TestCase):
+    lines = ["one", "two", "three", "four"]
+
+    def test_replaces_inclusive_range(self):
+        result = _apply_line_edits("a.md", self.lines, [edit(2, 3, "TWO\nTHREE\nMORE")])
+        self.assertEqual(result, ["one", "TWO", "THREE", "MORE", "four"])
+
+    def test_deletes_with_empty_replacement(self):
+        result = _apply_line_edits("a.md", self.lines, [edit(2, 2, "", "delete_redundant")])
+        self.assertEqual(result, ["one", "three", "four"])
+
+    def test_insertion_keeps_start_line(self):
+        result = _apply_line_edits("a.md", self.lines, [edit(2, 2, "new", "add_new")])
+        self.assertEqual(result, ["one", "new", "two", "three", "four"])
+
+    def test_insertion_at_end(self):
+        result = _apply_line_edits("a.md", self.lines, [edit(5, 5, "last", "enhance")])
+        self.assertEqual(result, self.lines + ["last"])
+
+    def test_insertion_precedes_replacement_on_same_line(self):
+        edits = [edit(2, 2, "TWO"), edit(2, 2, "before two", "add_new")]
+        result = _apply_line_edits("a.md", self.lines, edits)
+        self.assertEqual(result, ["one", "before two", "TWO", "three", "four"])
+
+    def test_line_numbers_refer_to_original_document(self):
+        edits = [edit(1, 1, "a\nb\nc"), edit(3, 3, "THREE")]
+        result = _apply_line_edits("a.md", self.lines, edits)
+        self.assertEqual(result, ["a", "b", "c", "two", "THREE", "four"])
+
+    def test_skips_overlapping_edit(self):
+        edits = [edit(1, 3, "X"), edit(2, 2, "Y")]
+        result = _apply_line_edits("a.md", self.lines, edits)
+        self.assertEqual(result, ["X", "four"])
+
+    def test_skips_invalid_line_numbers(self):
+        edits = [edit(0, 1, "X"), edit(3, 9, "Y"), edit(3, 1, "Z")]
+        result = _apply_line_edits("a.md", self.lines, edits)
+        self.assertEqual(result, self.lines)
+
+    def test_repeated_edit_applied_once(self):
+        edits = [edit(2, 2, "new", "add_new"), edit(2, 2, "new", "add_new")]
+        result = _apply_line_edits("a.md", self.lines, edits)
+        self.assertEqual(result, ["one", "new", "two", "three", "four"])
+
+    def test_matches_one_by_one_application(self):
+        rng = random.Random(0)
+        edit_types = ["add_new", "enhance", "update_outdated", "delete_redundant"]
+        for _ in range(2000):
+            lines = [f"line {i}" for i in range(rng.randint(0, 12))]
+            # Non-overlapping edits on distinct start lines
+            edits = []
+            cursor = 1
+            while cursor <= len(lines) + 1 and rng.random() < 0.7:
+                start_line = rng.randint(cursor, len(lines) + 1)
+                edit_type = rng.choice(edit_types)
+                if edit_type in ["add_new", "enhance"] or start_line > len(lines):
+                    edit_type = rng.choice(["add_new", "enhance"])
+                    end_line = start_line
+                    cursor = start_line + 1
+                else:
+                    end_line = rng.randint(start_line, len(lines))
+                    cursor = end_line + 1
+                text = "\n".join(f"new {rng.random()}" for _ in range(rng.randint(0, 3)))
+                edits.append(edit(start_line, end_line, text, edit_type))
+            rng.shuffle(edits)
+            with self.subTest(lines=lines, edits=edits):
+                self.assertEqual(
+                    _apply_line_edits("a.md", lines, edits),
+                    apply_one_by_one(lines, edits),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
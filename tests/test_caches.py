@@ -0,0 +1,146 @@
+"""Tests for the on-disk MCP search and doc writer caches."""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from docweaver import mcp_client, pipeline
+from docweaver.agents import DocEdit, DocOutput
+
+
+class InTempDirTestCase(unittest.TestCase):
+    """Runs each test in a fresh working directory, as the cache paths are relative."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class FakeSession:
+    def __init__(self, text='[{"path": "a.md"}]'):
+        self.calls = 0
+        self.text = text
+
+    async def call_tool(self, name, arguments):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+class SearchCacheTest(InTempDirTestCase):
+    def search(self, query, **kwargs):
+        async def run():
+            async with mcp_client.WeaviateDocsMCPClient(self._tmp.name) as client:
+                client._get_session = mock.AsyncMock(return_value=self.session)
+                return await client.search_docs(query, **kwargs)
+
+        return asyncio.run(run())
+
+    def setUp(self):
+        super().setUp()
+        self.session = FakeSession()
+
+    def test_hit_for_normalized_query(self):
+        self.assertEqual(self.search("Backup  Config"), [{"path": "a.md"}])
+        self.assertEqual(self.search("backup config"), [{"path": "a.md"}])
+        self.assertEqual(self.session.calls, 1)
+
+    def test_no_cache_queries_server(self):
+        self.search("backups")
+        self.search("backups", no_cache=True)
+        self.assertEqual(self.session.calls, 2)
+
+    def test_expired_entry_is_a_miss(self):
+        self.search("backups")
+        cache_path = mcp_client._search_cache_path("backups", "full_documents")
+        stale = time.time() - mcp_client.SEARCH_CACHE_TTL_SECONDS - 1
+        os.utime(cache_path, (stale, stale))
+        self.search("backups")
+        self.assertEqual(self.session.calls, 2)
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache_path = mcp_client._search_cache_path("backups", "full_documents")
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text('[{"path":', encoding="utf-8")
+        with self.assertLogs(mcp_client.logger, "WARNING"):
+            self.assertEqual(self.search("backups"), [{"path": "a.md"}])
+        self.assertEqual(self.session.calls, 1)
+
+    def test_prunes_oldest_entries_beyond_bound(self):
+        with mock.patch.object(mcp_client, "SEARCH_CACHE_MAX_ENTRIES", 2):
+            for i, query in enumerate(["one", "two", "three"]):
+                self.search(query)
+                # Distinct mtimes, oldest first
+                mtime = time.time() - 100 + i
+                cache_path = mcp_client._search_cache_path(query, "full_documents")
+                os.utime(cache_path, (mtime, mtime))
+            self.search("four")
+        cached = {p.name for p in Path(mcp_client.SEARCH_CACHE_DIR).iterdir()}
+        expected = {
+            mcp_client._search_cache_path(q, "full_documents").name
+            for q in ["three", "four"]
+        }
+        self.assertEqual(cached, expected)
+
+
+class DocWriterCacheTest(InTempDirTestCase):
+    outputs = [
+        DocOutput(
+            path="docs/a.md",
+            edits=[
+                DocEdit(
+                    comment="c",
+                    edit_type="add_new",
+                    justification="j",
+                    start_line=1,
+                    end_line=1,
+                    replacement_txt="new",
+                )
+            ],
+        )
+    ]
+
+    def setUp(self):
+        super().setUp()
+        Path(pipeline.DOC_WRITER_CACHE_DIR).mkdir(parents=True)
+
+    def test_round_trip(self):
+        cache_path = pipeline._doc_writer_cache_path("prompt")
+        self.assertIsNone(pipeline._read_cached_doc_outputs(cache_path))
+        pipeline._write_cached_doc_outputs(cache_path, self.outputs)
+        self.assertEqual(pipeline._read_cached_doc_outputs(cache_path), self.outputs)
+
+    def test_truncated_entry_is_a_miss(self):
+        cache_path = pipeline._doc_writer_cache_path("prompt")
+        cache_path.write_bytes(b'[{"path":')
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(pipeline._read_cached_doc_outputs(cache_path))
+
+    def test_failed_write_leaves_no_temp_file(self):
+        cache_path = pipeline._doc_writer_cache_path("prompt")
+        with mock.patch.object(pipeline.os, "replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                pipeline._write_cached_doc_outputs(cache_path, self.outputs)
+        self.assertEqual(list(cache_path.parent.iterdir()), [])
+
+    def test_key_covers_prompt_and_model_settings(self):
+        cache_path = pipeline._doc_writer_cache_path("prompt")
+        self.assertEqual(cache_path, pipeline._doc_writer_cache_path("prompt"))
+        self.assertNotEqual(cache_path, pipeline._doc_writer_cache_path("other prompt"))
+        with mock.patch.object(
+            pipeline.doc_writer_agent, "model_settings", {"max_tokens": 1}
+        ):
+            self.assertNotEqual(cache_path, pipeline._doc_writer_cache_path("prompt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
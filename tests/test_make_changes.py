@@ -0,0 +1,120 @@
+"""Tests for bundle scheduling in make_changes."""
+
+import asyncio
+import json
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from docweaver import pipeline
+from docweaver.agents import DocEdit, DocOutput
+
+from .test_caches import InTempDirTestCase
+
+
+def bundle(path, instructions="Add a note."):
+    return {
+        "primary_path": path,
+        "file_instructions": [{"path": path, "instructions": instructions}],
+    }
+
+
+class FakeWriter:
+    """Inserts one line at the top of the bundle's main file, recording what it saw."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run(self, prompt):
+        main_file = next(
+            line.split()[2] for line in prompt.splitlines() if "(MAIN FILE)" in line
+        )
+        self.prompts.append((main_file, prompt))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(main_file, 0))
+        self.in_flight -= 1
+        edit = DocEdit(
+            comment="c",
+            edit_type="add_new",
+            justification="j",
+            start_line=1,
+            end_line=1,
+            replacement_txt=f"edit {len(self.prompts)}",
+        )
+        output = [DocOutput(path=main_file, edits=[edit])]
+        return SimpleNamespace(output=output, usage=lambda: None)
+
+
+class MakeChangesOrderingTest(InTempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        Path("docs/a").mkdir(parents=True)
+        Path("docs/a/x.md").write_text("x1\nx2\n", encoding="utf-8")
+        Path("docs/a/y.md").write_text("y1\n", encoding="utf-8")
+
+    def make_changes(self, bundles, writer):
+        Path("instructions.log").write_text(json.dumps(bundles), encoding="utf-8")
+        with mock.patch.object(pipeline.doc_writer_agent, "run", writer.run):
+            return asyncio.run(
+                pipeline.make_changes(
+                    "feature",
+                    instructions_path="instructions.log",
+                    output_path="out/revised.log",
+                    edits_path="out/edits.log",
+                    no_cache=True,
+                )
+            )
+
+    def test_bundles_on_same_file_run_in_order(self):
+        # The first bundle on x.md is slow, so the second would overtake it
+        # if bundles on the same file were not ordered
+        writer = FakeWriter({"docs/a/x.md": 0.05})
+        result = self.make_changes(
+            [bundle("a/x.md", "first"), bundle("a/x.md", "second")], writer
+        )
+
+        first_prompt, second_prompt = (prompt for _, prompt in writer.prompts)
+        self.assertIn("first", first_prompt)
+        self.assertIn("1|edit 1", second_prompt)
+        self.assertEqual(writer.max_in_flight, 1)
+        self.assertEqual(
+            result["revised_documents"],
+            [{"path": "docs/a/x.md", "revised_doc": "edit 2\nedit 1\nx1\nx2"}],
+        )
+
+    def test_bundles_on_disjoint_files_run_concurrently(self):
+        writer = FakeWriter({"docs/a/x.md": 0.05})
+        self.make_changes([bundle("a/x.md"), bundle("a/y.md")], writer)
+        self.assertEqual(writer.max_in_flight, 2)
+
+    def test_edits_logged_in_bundle_order(self):
+        # y.md finishes first, but its edits belong to the second bundle
+        writer = FakeWriter({"docs/a/x.md": 0.05})
+        self.make_changes([bundle("a/x.md"), bundle("a/y.md")], writer)
+        with open("out/edits.log", encoding="utf-8") as f:
+            logged_paths = [json.loads(line)["path"] for line in f]
+        self.assertEqual(logged_paths, ["docs/a/x.md", "docs/a/y.md"])
+
+    def test_failing_bundle_does_not_stop_others(self):
+        def apply_line_edits(path, lines, edits):
+            if path == "docs/a/x.md":
+                raise KeyError("start_line")
+            return ["y0", "y1"]
+
+        writer = FakeWriter({})
+        with mock.patch.object(
+            pipeline, "_apply_line_edits", side_effect=apply_line_edits
+        ), self.assertLogs(level="ERROR"):
+            result = self.make_changes([bundle("a/x.md"), bundle("a/y.md")], writer)
+        self.assertEqual(
+            result["revised_documents"], [{"path": "docs/a/y.md", "revised_doc": "y0\ny1"}]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()